@@ -1,25 +1,260 @@
+import atexit
 import requests
+from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import json
 import datetime
 import os
 import operator
+import time
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - stdlib json works fine without it
+    orjson = None
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # Optional - uploads fall back to in-memory multipart
+    MultipartEncoder = None
+
+# Credentials are optional at import so the module can load in
+# environments (AWS Lambda, tests) that configure them afterwards via
+# set_credentials(); anything needing the team id validates lazily.
+cu_key = os.environ.get("CLICKUP_API_KEY")
+team_id = os.environ.get("CLICKUP_TEAM_ID")
+headers = {"Authorization": cu_key} if cu_key else None
+
+def _apply_headers(request):
+    """
+    Session auth hook - reads the module-level ``headers`` at request
+    time, so assigning ``clickuphelper.headers`` after import (the
+    documented AWS Lambda pattern) and set_credentials() both apply to
+    every request on the shared session.
+    """
+    if headers:
+        request.headers.update(headers)
+    return request
+
+
+# Shared session - reuses pooled TCP/TLS connections across calls rather
+# than paying a fresh handshake per request, and retries transient errors.
+_session = requests.Session()
+_session.auth = _apply_headers
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+
+def set_credentials(api_key=None, team=None):
+    """
+    Configure the API key and/or team id at runtime instead of through
+    the CLICKUP_API_KEY / CLICKUP_TEAM_ID environment variables.
+    """
+    global cu_key, team_id, headers
+    if api_key is not None:
+        cu_key = api_key
+        headers = {"Authorization": api_key}
+    if team is not None:
+        team_id = team
+        invalidate_caches()
+
+
+def _get_team_id():
+    if team_id is None:
+        raise RuntimeError(
+            "CLICKUP_TEAM_ID is not set.  Export the environment variable"
+            " or call clickuphelper.set_credentials(team=...)"
+        )
+    return team_id
+
+
+# API URL templates, built once at import and formatted with ids per call
+_API_URL = "https://api.clickup.com/api/v2"
+_TASK_URL = _API_URL + "/task/{}"
+_TASK_COMMENT_URL = _TASK_URL + "/comment"
+_TASK_FIELD_URL = _TASK_URL + "/field/{}"
+_TASK_TAG_URL = _TASK_URL + "/tag/{}"
+_TASK_ATTACHMENT_URL = _TASK_URL + "/attachment"
+_LIST_URL = _API_URL + "/list/{}"
+_LIST_FIELD_URL = _LIST_URL + "/field"
+_LIST_TASKS_URL = _LIST_URL + "/task"
+_SPACES_URL = _API_URL + "/team/{}/space"
+_FOLDERS_URL = _API_URL + "/space/{}/folder"
+_SPACE_LISTS_URL = _API_URL + "/space/{}/list"
+_FOLDER_LISTS_URL = _API_URL + "/folder/{}/list"
+_TEAM_VIEW_URL = _API_URL + "/team/{}/view"
+_TIME_ENTRIES_URL = _API_URL + "/team/{}/time_entries"
+
+
+def _json_loads(response):
+    """
+    Decode an API response body, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _ttl_cache(maxsize=256, ttl=30):
+    """
+    functools.lru_cache whose entries expire after ttl seconds, done by
+    folding the current time bucket into the cache key.
+    """
+
+    def decorator(func):
+        @functools.lru_cache(maxsize=maxsize)
+        def _cached(_ttl_bucket, *args):
+            return func(*args)
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            return _cached(int(time.monotonic() // ttl), *args)
+
+        wrapper.cache_clear = _cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
+# Parsed listing payloads keyed by (url, params) alongside the ETag the
+# server sent.  Once the TTL cache above expires, the next fetch
+# revalidates with If-None-Match and a 304 reuses the parsed body
+# without transferring or re-decoding it.  The cache is persisted to
+# disk (best-effort) so fresh processes start warm and revalidate with
+# cheap 304s instead of full transfers.
+_etag_cache = {}
+_etag_cache_dirty = False
+_ETAG_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "clickuphelper", "etag_cache.json"
+)
+
+
+def _load_etag_cache():
+    try:
+        with open(_ETAG_CACHE_PATH) as f:
+            entries = json.load(f)
+        for url, params, etag, data in entries:
+            key = (url, tuple(tuple(p) for p in params) if params else None)
+            _etag_cache[key] = (etag, data)
+    except (OSError, ValueError):
+        pass  # Missing or corrupt cache file - start cold
+
+
+def _save_etag_cache():
+    if not _etag_cache_dirty:
+        return
+    try:
+        os.makedirs(os.path.dirname(_ETAG_CACHE_PATH), exist_ok=True)
+        entries = [
+            [url, [list(p) for p in params] if params else None, etag, data]
+            for (url, params), (etag, data) in _etag_cache.items()
+        ]
+        tmp = _ETAG_CACHE_PATH + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp, _ETAG_CACHE_PATH)
+    except OSError:
+        pass  # Persistence is best-effort; in-memory caching still works
+
+
+_load_etag_cache()
+atexit.register(_save_etag_cache)
+
+
+def _get_revalidated(url, params=None):
+    global _etag_cache_dirty
+    key = (url, tuple(sorted(params.items())) if params else None)
+    cached = _etag_cache.get(key)
+    req_headers = {"If-None-Match": cached[0]} if cached else None
+    response = _session.get(url, params=params, headers=req_headers)
+    if response.status_code == 304 and cached:
+        return cached[1]
+    data = _json_loads(response)
+    etag = response.headers.get("ETag")
+    if etag:
+        _etag_cache[key] = (etag, data)
+        _etag_cache_dirty = True
+    return data
+
+
+@_ttl_cache(maxsize=256, ttl=30)
+def _get_spaces():
+    url = _SPACES_URL.format(_get_team_id())
+    return _get_revalidated(url, params={"archived": "false"})["spaces"]
+
+
+@_ttl_cache(maxsize=256, ttl=30)
+def _get_folders(space_id):
+    url = _FOLDERS_URL.format(space_id)
+    return _get_revalidated(url)["folders"]
 
-if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") is None:
-    cu_key = os.environ["CLICKUP_API_KEY"]
-    team_id = os.environ["CLICKUP_TEAM_ID"]
-    headers = {"Authorization": cu_key}
-else:
-    team_id = None  # AWS Lambda Functions must set modules' team_id
-    headers = None  # AWS Lambda Functions must set modules' header
+
+@_ttl_cache(maxsize=256, ttl=30)
+def _get_space_lists(space_id):
+    url = _SPACE_LISTS_URL.format(space_id)
+    return _get_revalidated(url, params={"archived": "false"})
+
+
+@_ttl_cache(maxsize=256, ttl=30)
+def _get_list(list_id):
+    url = _LIST_URL.format(list_id)
+    return _get_revalidated(url)
+
+
+@_ttl_cache(maxsize=256, ttl=30)
+def _get_list_fields(list_id):
+    url = _LIST_FIELD_URL.format(list_id)
+    return _get_revalidated(url)["fields"]
+
+
+@_ttl_cache(maxsize=256, ttl=30)
+def _get_folder_lists(folder_id):
+    url = _FOLDER_LISTS_URL.format(folder_id)
+    return _get_revalidated(url, params={"archived": "false"})
+
+
+def invalidate_caches():
+    """
+    Drop memoized listing responses.  Call after mutating workspace
+    topology (spaces/folders/lists) outside this module.
+    """
+    global _etag_cache_dirty
+    for f in (
+        _get_spaces,
+        _get_folders,
+        _get_space_lists,
+        _get_folder_lists,
+        _get_list,
+        _get_list_fields,
+    ):
+        f.cache_clear()
+    _etag_cache.clear()
+    _etag_cache_dirty = True
+    _label_maps.clear()
+
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+
+# 1971-01-01 in epoch milliseconds; anything in [0, here) lands in 1970
+_MS_1971 = 31536000000
 
 
 def ts_ms_to_dt(ts, except_if_year_1970=True):
     if isinstance(ts, str):
-        ts = float(ts)
+        ts = int(ts)
 
-    dt = datetime.datetime.fromtimestamp(ts / 1000, datetime.UTC)
-
-    if except_if_year_1970 and dt.year == 1970:
+    if except_if_year_1970 and 0 <= ts < _MS_1971:
         msg = (
             "Year is 1970 - timestamp input probably"
             " is in seconds not milliseconds. Verify and fix or"
@@ -28,7 +263,94 @@ def ts_ms_to_dt(ts, except_if_year_1970=True):
 
         raise ValueError(msg)
 
-    return dt
+    # Epoch + timedelta keeps the millisecond math in integers instead of
+    # routing through float seconds in fromtimestamp
+    return _EPOCH + datetime.timedelta(milliseconds=ts)
+
+
+# Custom field value parsers, one per clickup field type, dispatched by
+# Task.get_field.  Each takes the raw field object and returns the value.
+
+
+def _parse_field_number(field):
+    # Cast to int, if fails, try cast to float
+    try:
+        return int(field["value"])
+    except ValueError:
+        try:
+            return float(field["value"])
+        except ValueError as e:
+            raise ValueError(f"Cannot cast {field['value']} to int or float") from e
+
+
+def _parse_field_drop_down(field):
+    """
+    Clickup dropdowns give an integer value and a
+    a list of possible options.  Parse and return.
+    """
+    index = field["value"]
+    return field["type_config"]["options"][index]["name"]
+
+
+# Forward/reverse label option maps keyed by custom field id.  A label
+# field's options are stable within a session, so build the dicts once
+# per field instead of per value lookup.
+_label_maps = {}
+
+
+def _get_label_maps(field):
+    maps = _label_maps.get(field["id"])
+    if maps is None:
+        options = field["type_config"]["options"]
+        id_to_label = {option["id"]: option["label"] for option in options}
+        label_to_id = {option["label"]: option["id"] for option in options}
+        maps = (id_to_label, label_to_id)
+        _label_maps[field["id"]] = maps
+    return maps
+
+
+def _parse_field_labels(field):
+    v = []
+    value_ids = field["value"]
+    id_to_label = _get_label_maps(field)[0]
+    for value_id in value_ids:
+        if value_id in id_to_label:
+            v.append(id_to_label[value_id])
+    return v
+
+
+def _parse_field_tasks(field):
+    v = field["value"]  # Task json object(s), list
+    if len(v) == 1:  # Unpack list if length is 1
+        v = v[0]
+    return v
+
+
+def _parse_field_date(field):
+    return ts_ms_to_dt(field["value"])
+
+
+def _parse_field_value(field):
+    return field["value"]
+
+
+_FIELD_PARSERS = {
+    "number": _parse_field_number,
+    "drop_down": _parse_field_drop_down,
+    "labels": _parse_field_labels,
+    "url": _parse_field_value,
+    "text": _parse_field_value,
+    "tasks": _parse_field_tasks,
+    "date": _parse_field_date,
+    # Consider future debugging/branching on value['type'] for attachments
+    "attachment": _parse_field_value,
+    "short_text": _parse_field_value,
+}
+
+
+# Sentinel distinguishing "key absent" from a stored None in dict.get
+# fast paths, sidestepping try/except overhead on lookup misses
+_MISSING = object()
 
 
 class MissingCustomField(KeyError):
@@ -39,6 +361,42 @@ class MissingCustomFieldValue(KeyError):
     pass
 
 class Task:  # Technically Clickup Task View
+
+    # Fixed attribute set - avoids a per-instance __dict__, which matters
+    # when Tasks materializes thousands of these from paginated pages
+    __slots__ = (
+        "verbose",
+        "include_subtasks",
+        "except_missing_cf_value",
+        "raw_task",
+        "id",
+        "task",
+        "name",
+        "creator",
+        "created",
+        "updated",
+        "status",
+        "linked_tasks",
+        "_custom_fields",
+    )
+
+    # Background GETs started by Task.prefetch, keyed on task_id, so
+    # construction can consume an already in-flight response instead of
+    # blocking on a fresh round-trip.
+    _prefetch_pool = ThreadPoolExecutor(max_workers=16)
+    _prefetch = {}
+
+    @classmethod
+    def prefetch(cls, task_ids):
+        """
+        Start background fetches for task_ids ahead of Task() construction.
+        """
+        for task_id in task_ids:
+            if task_id not in cls._prefetch:
+                cls._prefetch[task_id] = cls._prefetch_pool.submit(
+                    _session.get, _TASK_URL.format(task_id)
+                )
+
     def __init__(
         self,
         task_id,  # : str | dict,  # add annotation back in py 3.10
@@ -57,9 +415,9 @@ class Task:  # Technically Clickup Task View
         self.except_missing_cf_value = except_missing_cf_value
         self.raw_task = raw_task
 
-        # Remove '#' character from task_id if it's a string
+        # Remove leading '#' characters from task_id if it's a string
         if isinstance(task_id, str):
-            task_id = task_id.replace('#', '')
+            task_id = task_id.lstrip('#')
 
         self.reinitialize(task_id)
 
@@ -73,15 +431,21 @@ class Task:  # Technically Clickup Task View
             if self.include_subtasks:
                 query = {
                     "custom_task_ids": "true",
-                    "team_id": team_id,
+                    "team_id": _get_team_id(),
                     "include_subtasks": "true",  # Do not change to python True
                 }
             else:
                 query = {}
 
-            url = f"https://api.clickup.com/api/v2/task/{task_id}"
-            q = requests.get(url, headers=headers, params=query)
-            task = q.json()
+            # Prefetched responses never include subtasks, so only use
+            # one when this task doesn't ask for them.
+            fut = None if self.include_subtasks else Task._prefetch.pop(task_id, None)
+            if fut is not None:
+                task = _json_loads(fut.result())
+            else:
+                url = _TASK_URL.format(task_id)
+                q = _session.get(url, params=query)
+                task = _json_loads(q)
         elif isinstance(task_id, dict):
             if self.include_subtasks:
                 raise NotImplementedError(
@@ -96,6 +460,12 @@ class Task:  # Technically Clickup Task View
         else:
             raise NotImplementedError("task_id must be str or dict")
 
+        self._set_task(task)
+
+    def _set_task(self, task):
+        """
+        Refresh parsed attributes from a raw clickup task object.
+        """
         # Store raw task response
         self.task = task
 
@@ -114,11 +484,24 @@ class Task:  # Technically Clickup Task View
         # Add linked_tasks attribute
         self.linked_tasks = task.get("linked_tasks", [])
 
-        # Create dictionary of custom field names to custom field items
+        # Name->field dictionary is built lazily by the custom_fields
+        # property - bulk constructions from the paginated endpoint often
+        # never look at custom fields at all
+        self._custom_fields = None
+
+    @property
+    def custom_fields(self):
+        """
+        Dictionary of custom field names to custom field items.
+        """
         # Hope that custom field names are unique - may cause bugs
         # self.custom_fields = defaultdict(list)
         # [self.custom_fields[item['name']].append(item) for item in task['custom_fields']]
-        self.custom_fields = {item["name"]: item for item in task["custom_fields"]}
+        if self._custom_fields is None:
+            self._custom_fields = {
+                item["name"]: item for item in self.task["custom_fields"]
+            }
+        return self._custom_fields
 
     def get_field_names(self):
         """
@@ -133,7 +516,7 @@ class Task:  # Technically Clickup Task View
         except KeyError as e:
             msg = (
                 f"Unable to find custom field key '{name}'."
-                f" Available fields are {list(self.get_field_names())}"
+                f" Available fields are {list(self.custom_fields)}"
             )
             raise MissingCustomField(msg) from e
         return field
@@ -146,77 +529,34 @@ class Task:  # Technically Clickup Task View
 
         return self.get_field_obj(name)["type"]
 
+    def _print_field(self, name, field, prefix=""):
+        print(f"{prefix}Looking up custom field:  {name} in task {self.id}")
+        print(json.dumps(field, indent=2))
+
     def get_field(self, name):
 
         field = self.get_field_obj(name)
 
-        def print_field(prefix=""):
-            print(f"{prefix}Looking up custom field:  {name} in task {self.id}")
-            print(json.dumps(field, indent=2))
-
-        # Refactor as match/case once 3.10 is sane
+        # Dispatch on field type through the module-level parser table
         t = field["type"]
+        parser = _FIELD_PARSERS.get(t)
+        if parser is None:
+            raise NotImplementedError(f"No get_field case for clickup task type '{t}'")
 
-        try:  # Catchall - if except call print_field and raise
-            if t == "number":
-                # Cast to int, if fails, try cast to float
-                try:
-                    v = int(field["value"])
-                except ValueError:
-                    try:
-                        v = float(field["value"])
-                    except ValueError as e:
-                        raise ValueError(
-                            f"Cannot cast {field['value']} to int or float"
-                        ) from e
-            elif t == "drop_down":
-                """
-                Clickup dropdowns give an integer value and a
-                a list of possible options.  Parse and return.
-                """
-                index = field["value"]
-                v = field["type_config"]["options"][index]["name"]
-            elif t == "labels":
-                v = []
-                value_ids = field["value"]
-                options = field["type_config"]["options"]
-                id_to_label = {option["id"]: option["label"] for option in options}
-                for value_id in value_ids:
-                    if value_id in id_to_label:
-                        v.append(id_to_label[value_id])
-            elif t == "url":
-                v = field["value"]
-            elif t == "text":
-                v = field["value"]
-            elif t == "tasks":
-                v = field["value"]  # Task json object(s), list
-                if len(v) == 1:  # Unpack list if length is 1
-                    v = v[0]
-            elif t == "date":
-                v = ts_ms_to_dt(field["value"])
-            elif t == "attachment":
-                v = field["value"]
-                # Consider future debugging/branching on v['type']
-            elif t == "short_text":
-                v = field["value"]
-            else:
-                raise NotImplementedError(
-                    f"No get_field case for clickup task type '{t}'"
-                )
+        try:  # Catchall - if except call _print_field and raise
+            v = parser(field)
         except KeyError as e:
+            if self.verbose:
+                self._print_field(name, field, "ERROR: ")
             if self.except_missing_cf_value:
-                if self.verbose:
-                    print_field("ERROR: ")
                 raise MissingCustomFieldValue(
                     f"task {self.id} missing custom field value {field['name']}"
                 ) from e
             else:
-                if self.verbose:
-                    print_field("ERROR: ")
                 return None
 
         if self.verbose:
-            print_field()
+            self._print_field(name, field)
         return v
 
     def __getitem__(self, item):
@@ -225,16 +565,29 @@ class Task:  # Technically Clickup Task View
         """
         return self.get_field(item)
 
+    def get_many(self, names):
+        """
+        Return a dict of field name to parsed value for several custom
+        fields in one call.
+        """
+        return {name: self.get_field(name) for name in names}
+
     def to_file(self, filename, indent=2):
         """
         Write raw clickup task json to disk
         """
-        with open(filename, "w") as f:
-            json.dump(f, self.task, indent=indent)
+        if orjson is not None and indent == 2:
+            # Serialize straight to bytes - no intermediate str encode
+            # (orjson only offers two-space indentation)
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(self.task, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, "w") as f:
+                json.dump(self.task, f, indent=indent)
 
     def post_comment(self, comment, notify_all=False, reinitialize=True):
 
-        url = f"https://api.clickup.com/api/v2/task/{self.id}/comment"
+        url = _TASK_COMMENT_URL.format(self.id)
 
         payload = {
             "comment_text": f"{comment}",
@@ -250,20 +603,25 @@ class Task:  # Technically Clickup Task View
         # }
         query = {}
 
-        response = requests.post(url, json=payload, headers=headers, params=query)
+        response = _session.post(url, json=payload, params=query)
 
-        data = response.json()
+        data = _json_loads(response)
 
         if reinitialize:
+            # Comments aren't part of the parsed task attributes, but
+            # refetch so date_updated/updated reflect the new comment;
+            # pass reinitialize=False to skip the extra GET
             self.reinitialize(self.id)
 
         return data
 
     def post_custom_field(self, field, value, reinitialize=True, value_options=None, use_time=False):
-        # Get field ID and type
-        fid = self.get_field_id(field)
-        ftype = self.get_field_type(field)
-        url = f"https://api.clickup.com/api/v2/task/{self.id}/field/{fid}"
+        # Look the field object up once - id, type, and options all come
+        # from the same dict
+        fobj = self.get_field_obj(field)
+        fid = fobj["id"]
+        ftype = fobj["type"]
+        url = _TASK_FIELD_URL.format(self.id, fid)
 
         payload = {"value": value}
 
@@ -277,25 +635,25 @@ class Task:  # Technically Clickup Task View
         
         elif ftype == "drop_down":
             try:
-                int(value)
+                # Coerce numeric strings to the canonical integer index
+                # so the local patch below stores what the server stores
+                payload["value"] = int(value)
             except ValueError:
                 # Translate string to clickup integer lookup
-                obj = self.get_field_obj(field)
                 lookup = {}
-                for item in obj["type_config"]["options"]:
+                for item in fobj["type_config"]["options"]:
                     lookup[item["name"]] = item["orderindex"]
                 try:
                     payload["value"] = lookup[value]
                 except KeyError:
+                    # Unknown option name posts through as the raw
+                    # string; the server rejects it and the response.ok
+                    # gate below keeps local state untouched
                     pass
 
         elif ftype == "labels":
             # Handle labels field type
-            obj = self.get_field_obj(field)
-            label_lookup = {
-                option["label"]: option["id"] 
-                for option in obj["type_config"]["options"]
-            }
+            label_lookup = _get_label_maps(fobj)[1]
             
             # Convert single string to list for consistent handling
             if isinstance(value, str):
@@ -310,29 +668,37 @@ class Task:  # Technically Clickup Task View
                 raise ValueError(f"Invalid label name. Available labels are: {available_labels}") from e
 
         query = {}
-        response = requests.post(url, json=payload, headers=headers, params=query)
+        response = _session.post(url, json=payload, params=query)
 
-        if reinitialize:
-            self.reinitialize(self.id)
+        if reinitialize and response.ok:
+            # The field endpoint returns an empty body; patch the local
+            # field object in place instead of refetching the whole task.
+            # Only do so once the server accepted the value - otherwise
+            # local state would report a value the server rejected.
+            fobj["value"] = payload["value"]
 
         return response
 
     def post_status(self, status, reinitialize=True):
 
-        url = "https://api.clickup.com/api/v2/task/" + self.id
+        url = _TASK_URL.format(self.id)
 
-        query = {"custom_task_ids": "true", "team_id": team_id}
+        query = {"custom_task_ids": "true", "team_id": _get_team_id()}
 
         # https://clickup.com/api/clickupreference/operation/UpdateTask/
         # Same endpoint can also update name/desc/ several other fields
         payload = {"status": str(status)}
 
         # payload = {"status": {"orderindex" : 0 }}
-        response = requests.put(url, json=payload, headers=headers, params=query)
-        data = response.json()
+        response = _session.put(url, json=payload, params=query)
+        data = _json_loads(response)
 
-        if reinitialize:
-            self.reinitialize(self.id)
+        if reinitialize and response.ok and "err" not in data:
+            # The update response is the full task object - refresh local
+            # state from it rather than issuing another GET.  Error
+            # bodies ({"err": ..., "ECODE": ...}) are returned as-is
+            # without touching local state.
+            self._set_task(data)
 
         return data
 
@@ -344,11 +710,17 @@ class Task:  # Technically Clickup Task View
         :param tag_ids: A list of tag IDs to add to the task
         :return: A dictionary containing the task ID and the list of added tag IDs
         """
-        for tag_id in tag_ids:
-            url = f"https://api.clickup.com/api/v2/task/{self.id}/tag/{tag_id}"
-            response = requests.post(url, headers=headers)
-            if response.status_code != 200:
-                raise Exception(f"Failed to add tag {tag_id}. Status code: {response.status_code}")
+        # The API only takes one tag per POST; issue them concurrently
+        # instead of serially waiting out a round-trip per tag
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            futs = {
+                tag_id: ex.submit(_session.post, _TASK_TAG_URL.format(self.id, tag_id))
+                for tag_id in tag_ids
+            }
+            for tag_id, fut in futs.items():
+                response = fut.result()
+                if response.status_code != 200:
+                    raise Exception(f"Failed to add tag {tag_id}. Status code: {response.status_code}")
 
         self.reinitialize(self.id)  # Refresh the task data
         return {"task_id": self.id, "tag_ids": tag_ids}
@@ -362,29 +734,37 @@ class Task:  # Technically Clickup Task View
             :param parent_field_id: this is for posting to a custom field of a file task
             :return: JSON response from the Clickup API
             """
-            url = f"https://api.clickup.com/api/v2/task/{self.id}/attachment"
+            url = _TASK_ATTACHMENT_URL.format(self.id)
 
             # Ensure the file exists
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"File not found: {file_path}")
 
-            # Prepare the file for upload
-            files = {
-                'attachment': (os.path.basename(file_path), open(file_path, 'rb'))
-            }
-
             # Prepare the parameters
             params = {
                 "custom_task_ids": "true",
-                "team_id": team_id  # Assuming team_id is available in the module scope
+                "team_id": _get_team_id()
             }
 
             if parent_field_id:
                 params['hidden'] = True
                 params['parent'] = parent_field_id
 
-            # Make the API request
-            response = requests.post(url, headers=headers, params=params, files=files)
+            # Make the API request, streaming the multipart body from
+            # disk when requests_toolbelt is available rather than
+            # assembling the whole file in memory
+            with open(file_path, 'rb') as fh:
+                fields = {'attachment': (os.path.basename(file_path), fh)}
+                if MultipartEncoder is not None:
+                    encoder = MultipartEncoder(fields=fields)
+                    response = _session.post(
+                        url,
+                        params=params,
+                        data=encoder,
+                        headers={"Content-Type": encoder.content_type},
+                    )
+                else:
+                    response = _session.post(url, params=params, files=fields)
 
             # Check for successful upload
             if response.status_code == 200:
@@ -392,10 +772,7 @@ class Task:  # Technically Clickup Task View
             else:
                 print(f"Failed to upload file. Status code: {response.status_code}")
 
-            # Close the file
-            files['attachment'][1].close()
-
-            return response.json()
+            return _json_loads(response)
 
     def attach_file_to_custom_field(self, custom_field_name, file_path):
         """
@@ -422,7 +799,7 @@ class Task:  # Technically Clickup Task View
 
 def post_task(list_id, task_name, task_description="", status="Open", custom_fields={}, debug=False):
 
-    url = f"https://api.clickup.com/api/v2/list/{list_id}/task"
+    url = _LIST_TASKS_URL.format(list_id)
 
     # Need to retrieve information about list in question
     postlist = List(list_id)
@@ -489,7 +866,7 @@ def post_task(list_id, task_name, task_description="", status="Open", custom_fie
         print("Payload:")
         print(json.dumps(payload, indent=2))
 
-    response = requests.post(url, json=payload, headers=headers)
+    response = _session.post(url, json=payload)
 
     if debug:
         print("Response Status Code:", response.status_code)
@@ -499,18 +876,57 @@ def post_task(list_id, task_name, task_description="", status="Open", custom_fie
             print("Response Text:", response.text)
 
     response.raise_for_status()
-    
+
     return response
 
 
+def post_comments(task_comments, notify_all=False):
+    """
+    Post comments to many tasks concurrently.  task_comments is an
+    iterable of (task_id, comment) pairs; returns a dict of task_id to
+    the posted comment response data.  Per-task failures surface as the
+    stored exception rather than aborting the whole batch.
+    """
+
+    def _post(task_id, comment):
+        url = _TASK_COMMENT_URL.format(task_id)
+        payload = {
+            "comment_text": f"{comment}",
+            "assignee": None,
+            "notify_all": notify_all,
+        }
+        response = _session.post(url, json=payload)
+        return _json_loads(response)
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = {
+            task_id: ex.submit(_post, task_id, comment)
+            for task_id, comment in task_comments
+        }
+        ret = {}
+        for task_id, fut in futures.items():
+            try:
+                ret[task_id] = fut.result()
+            except Exception as e:  # noqa: BLE001 - keep batch going
+                ret[task_id] = e
+        return ret
+
+
 class List:
+
+    __slots__ = (
+        "fields",
+        "field_lookup",
+        "data",
+        "id",
+        "name",
+        "statuses",
+        "status_names",
+    )
+
     def __init__(self, list_id):
-        url = "https://api.clickup.com/api/v2/list/" + list_id
-        response = requests.get(url, headers=headers)
-        data = response.json()
-        url = "https://api.clickup.com/api/v2/list/" + list_id + "/field"
-        response = requests.get(url, headers=headers)
-        self.fields = response.json()["fields"]
+        data = _get_list(list_id)
+        self.fields = _get_list_fields(list_id)
 
         self.field_lookup = {cf["name"]: cf for cf in self.fields}
 
@@ -536,222 +952,238 @@ class Workspace:
     """
 
     def __init__(self):
-        url = "https://api.clickup.com/api/v2/team/" + team_id + "/view"
-        response = requests.get(url, headers=headers)
+        url = _TEAM_VIEW_URL.format(_get_team_id())
+        response = _session.get(url)
 
-        self.data = response.json()
+        self.data = _json_loads(response)
         print(json.dumps(self.data, indent=2))
 
 
-class Spaces:
-    def __init__(self):
-        """
-        Find all the Clickup Spaces within a given team.  For now read-only, but the API
-        also supports creation/put/delete for the needlessly bold
-        """
-
-        url = "https://api.clickup.com/api/v2/team/" + team_id + "/space"
-
-        query = {"archived": "false"}
-
-        response = requests.get(url, headers=headers, params=query)
-
-        self.spaces = response.json()["spaces"]
-
-        # what do I even want here
-        self.space_names = [i["name"] for i in self.spaces]
-        self.space_ids = [i["id"] for i in self.spaces]
-        self.space_lookup = {k: v for (k, v) in zip(self.space_names, self.space_ids)}
-
-    def get_names(self):
-        return self.space_names
-
-    def get_id(self, name):
-
-        try:
-            return self.space_lookup[name]
-        except KeyError as e:
-            msg = f"Space names in workspace are {self.space_names}"
-            raise KeyError(msg) from e
-
-    def __getitem__(self, name):
-
-        return self.get_id(name)
-
-    def __iter__(self):
-        return iter(self.spaces)
-
-
-class Folders:
-    def __init__(self, space_id):
-
-        url = "https://api.clickup.com/api/v2/space/" + space_id + "/folder"
+class _Listing:
+    """
+    Shared machinery for the workspace listing collections below: fetch
+    the payload through the memoized module-level getter, build name/id
+    lookups in one pass, and resolve names to ids with a helpful error.
+    """
 
-        query = {"archived": "false"}
-        query = {}
+    __slots__ = ("data", "items", "names", "ids", "lookup")
 
-        response = requests.get(url, headers=headers, params=query)
+    # Subclasses set _fetch to the cached fetcher, _items_key when the
+    # item list is nested inside the payload, and _err_msg for lookups.
+    _items_key = None
+    _err_msg = "Names are {}"
 
-        data = response.json()
-        self.folders = data["folders"]
+    def __init__(self, *args):
+        self.data = self._fetch(*args)
+        if self._items_key is None:
+            self.items = self.data
+        else:
+            self.items = self.data[self._items_key]
 
-        self.folder_names = [i["name"] for i in self.folders]
-        self.folder_ids = [i["id"] for i in self.folders]
-        self.folder_lookup = {
-            k: v for (k, v) in zip(self.folder_names, self.folder_ids)
-        }
+        self.names = []
+        self.ids = []
+        self.lookup = {}
+        for i in self.items:
+            self.names.append(i["name"])
+            self.ids.append(i["id"])
+            self.lookup[i["name"]] = i["id"]
 
     def get_names(self):
-        return self.folder_names
+        return self.names
 
     def get_id(self, name):
 
-        try:
-            return self.folder_lookup[name]
-        except KeyError as e:
-            msg = f"Folder names are {self.folder_names}"
-            raise KeyError(msg) from e
+        found = self.lookup.get(name, _MISSING)
+        if found is _MISSING:
+            raise KeyError(self._err_msg.format(self.names))
+        return found
 
     def __getitem__(self, name):
 
         return self.get_id(name)
 
     def __iter__(self):
-        return iter(self.folders)
-
+        return iter(self.items)
 
-class SpaceLists:
-    def __init__(self, space_id):
 
-        url = "https://api.clickup.com/api/v2/space/" + space_id + "/list"
-
-        query = {"archived": "false"}
-
-        response = requests.get(url, headers=headers, params=query)
-
-        data = response.json()
-        self.data = data
-        self.lists = data["lists"]
+class Spaces(_Listing):
 
-        self.list_names = [i["name"] for i in self.lists]
-        self.list_ids = [i["id"] for i in self.lists]
-        self.list_lookup = {k: v for (k, v) in zip(self.list_names, self.list_ids)}
-
-    def get_names(self):
-        return self.list_names
-
-    def get_id(self, name):
-
-        try:
-            return self.list_lookup[name]
-        except KeyError as e:
-            msg = f"List names are {self.list_names}"
-            raise KeyError(msg) from e
+    """
+    Find all the Clickup Spaces within a given team.  For now read-only, but the API
+    also supports creation/put/delete for the needlessly bold
+    """
 
-    def __getitem__(self, name):
+    __slots__ = ()
+    _fetch = staticmethod(_get_spaces)
+    _err_msg = "Space names in workspace are {}"
 
-        return self.get_id(name)
+    # Pre-rename attribute spellings
+    spaces = property(operator.attrgetter("items"))
+    space_names = property(operator.attrgetter("names"))
+    space_ids = property(operator.attrgetter("ids"))
+    space_lookup = property(operator.attrgetter("lookup"))
 
-    def __iter__(self):
-        return iter(self.lists)
 
+class Folders(_Listing):
 
-class FolderLists:
-    def __init__(self, folder_id):
+    __slots__ = ()
+    _fetch = staticmethod(_get_folders)
+    _err_msg = "Folder names are {}"
 
-        url = "https://api.clickup.com/api/v2/folder/" + folder_id + "/list"
+    folders = property(operator.attrgetter("items"))
+    folder_names = property(operator.attrgetter("names"))
+    folder_ids = property(operator.attrgetter("ids"))
+    folder_lookup = property(operator.attrgetter("lookup"))
 
-        query = {"archived": "false"}
 
-        response = requests.get(url, headers=headers, params=query)
+class SpaceLists(_Listing):
 
-        data = response.json()
-        self.data = data
+    __slots__ = ()
+    _fetch = staticmethod(_get_space_lists)
+    _items_key = "lists"
+    _err_msg = "List names are {}"
 
-        self.lists = data["lists"]
+    lists = property(operator.attrgetter("items"))
+    list_names = property(operator.attrgetter("names"))
+    list_ids = property(operator.attrgetter("ids"))
+    list_lookup = property(operator.attrgetter("lookup"))
 
-        self.list_names = [i["name"] for i in self.lists]
-        self.list_ids = [i["id"] for i in self.lists]
-        self.list_lookup = {k: v for (k, v) in zip(self.list_names, self.list_ids)}
 
-    def get_names(self):
-        return self.list_names
+class FolderLists(_Listing):
 
-    def get_id(self, name):
+    __slots__ = ()
+    _fetch = staticmethod(_get_folder_lists)
+    _items_key = "lists"
+    _err_msg = "List names are {}"
 
-        try:
-            return self.list_lookup[name]
-        except KeyError as e:
-            msg = f"List names are {self.list_names}"
-            raise KeyError(msg) from e
+    lists = property(operator.attrgetter("items"))
+    list_names = property(operator.attrgetter("names"))
+    list_ids = property(operator.attrgetter("ids"))
+    list_lookup = property(operator.attrgetter("lookup"))
 
-    def __getitem__(self, name):
 
-        return self.get_id(name)
-
-    def __iter__(self):
-        return iter(self.lists)
+class Tasks:
 
+    __slots__ = ("tasks", "task_names", "task_ids", "tag_lookup", "_task_data")
 
-class Tasks:
-    def __init__(self, list_id, include_closed=False):
+    def __init__(self, list_id, include_closed=False, include_subtasks=False):
 
         # https://clickup.com/api/clickupreference/operation/GetTasks/
         # This takes a lot more params/filters than implemented here
-        url = "https://api.clickup.com/api/v2/list/" + list_id + "/task"
+        url = _LIST_TASKS_URL.format(list_id)
 
-        query = {"archived": "false", "page": 0}
+        query = {"archived": "false"}
         if include_closed:
             query["include_closed"] = "true"
-
-        self.tasks = {}
-        self.task_names = []
-        self.task_ids = []
-
-        # Clickup API endpoint is paginated - iterate until depleted.
+        if include_subtasks:
+            # Subtask rows ride along flat in the same paginated pages
+            # (each carries a 'parent' key) - one bulk fetch instead of a
+            # task GET per parent when walking a tree
+            query["subtasks"] = "true"
+
+        # Clickup API endpoint is paginated at 100 tasks/page with no
+        # inter-page dependency, so fetch speculative windows of pages
+        # concurrently rather than waiting out one round-trip per page.
+        # A page shorter than page_size means the list is depleted.
+        window = 8
+        page_size = 100
+        page = 0
+        raw_tasks = []
         while True:
-            response = requests.get(url, headers=headers, params=query)
-            data = response.json()
-            if len(data["tasks"]) == 0:  # Page is empty, break loop
+            with ThreadPoolExecutor(max_workers=window) as ex:
+                futs = [
+                    ex.submit(_session.get, url, params={**query, "page": page + i})
+                    for i in range(window)
+                ]
+                pages = [_json_loads(f.result())["tasks"] for f in futs]
+            for p in pages:
+                raw_tasks.extend(p)
+            if any(len(p) < page_size for p in pages):
                 break
-            # count = len(data["tasks"])
-            # print(f" adding {count}")
+            page += window
 
-            # print(json.dumps(data["tasks"],indent=2))
-            for task in data["tasks"]:
-                self.tasks[task["id"]] = Task(task)
+        # Keep the raw rows and wrap them in Task objects only when a
+        # task is actually accessed; bulk consumers mostly iterate ids
+        # or read raw fields and never need every wrapper built
+        self._task_data = {task["id"]: task for task in raw_tasks}
+        self.tasks = {}
+        self.task_names = [i["name"] for i in raw_tasks]
+        self.task_ids = [i["id"] for i in raw_tasks]
 
-            self.task_names += [i["name"] for i in data["tasks"]]
-            self.task_ids += [i["id"] for i in data["tasks"]]
-            query["page"] += 1
+        # Inverted tag index so tag filters cost O(matches), not a scan
+        # of every task's tag list per query
+        self.tag_lookup = {}
+        for task in raw_tasks:
+            for tag in task.get("tags", []):
+                self.tag_lookup.setdefault(tag["name"], []).append(task["id"])
 
     def __getitem__(self, task_id):
-        try:
-            return self.tasks[task_id]
-        except KeyError as e:
+        task = self.tasks.get(task_id, _MISSING)
+        if task is not _MISSING:
+            return task
+        raw = self._task_data.get(task_id, _MISSING)
+        if raw is _MISSING:
             msg = f"Task ids in this folder are {self.task_ids}"
-            raise KeyError(msg) from e
-        # return self.get_id(name)
+            raise KeyError(msg)
+        # Materialize on first access and cache for repeat lookups
+        task = Task(raw)
+        self.tasks[task_id] = task
+        return task
 
     def __iter__(self):
-        return iter(self.tasks)
+        return iter(self._task_data)
+
+    def get_many(self, task_ids):
+        """
+        Return a dict of task_id to Task for the given ids.  Unknown ids
+        raise the same KeyError as indexing would.
+        """
+        return {task_id: self[task_id] for task_id in task_ids}
+
+    def filter_by_tag(self, tag_name):
+        """
+        Return a dict of task_id to Task for tasks carrying tag_name,
+        resolved through the inverted tag index.
+        """
+        return self.get_many(self.tag_lookup.get(tag_name, []))
+
+    @staticmethod
+    def _raw_field_value(by_name, field):
+        """
+        Parse one custom field out of a name-to-field map, returning
+        (value, found).  found is False when the field holds no value.
+        """
+        fobj = by_name.get(field, _MISSING)
+        if fobj is _MISSING:
+            msg = (
+                f"Unable to find custom field key '{field}'."
+                f" Available fields are {list(by_name)}"
+            )
+            raise MissingCustomField(msg)
+        t = fobj["type"]
+        parser = _FIELD_PARSERS.get(t)
+        if parser is None:
+            raise NotImplementedError(f"No get_field case for clickup task type '{t}'")
+        try:
+            return parser(fobj), True
+        except KeyError:  # Field present but holds no value
+            return None, False
 
     def get_field(self, fields):
         if isinstance(fields, str):
             fields = [fields]
 
         ret = {}
-        for task_id in self:
+        # Parse straight out of the raw custom_fields lists - one walk
+        # per task, no Task materialization and no exception-driven
+        # per-field lookups
+        for task_id, raw in self._task_data.items():
+            by_name = {f["name"]: f for f in raw["custom_fields"]}
             task_fields = {}
             found_fields = 0
             for field in fields:
-                try:
-                    value = self[task_id].get_field(field)
-                    found_fields += 1
-                except MissingCustomFieldValue:
-                    value = None
-                    pass
-                # print(f"{field} {task_id} {value}")
+                value, found = self._raw_field_value(by_name, field)
+                found_fields += found
                 task_fields[field] = value
             if found_fields:
                 # Only add task_id to return if at least one of the fields requested returns
@@ -770,36 +1202,37 @@ class Tasks:
         if isinstance(filter_payload, tuple):
             filter_payload = [filter_payload]
 
+        # Normalize the filter tuples once, outside the per-task loop
+        filters = []
+        for filt in filter_payload:
+            comparator = filt[2] if len(filt) >= 3 else operator.eq
+            filters.append((filt[0], filt[1], comparator))
+
         ret = {}
-        for task_id in self:
+        # Same raw-row walk as get_field - no Task wrapper or repeated
+        # __getitem__ hash lookups inside the filter loop
+        for task_id, raw in self._task_data.items():
+            by_name = {f["name"]: f for f in raw["custom_fields"]}
             task_fields = {}
-            matched_fields = 0
-            for filt in filter_payload:
-                fieldname = filt[0]
-                filtvalue = filt[1]
-                if len(filt) < 3:
-                    comparator = operator.eq
-                else:
-                    comparator = filt[2]
-
+            matched = True
+            for fieldname, filtvalue, comparator in filters:
                 # print(f"name {fieldname}, value {filtvalue}, comparator {comparator}")
-                try:
-                    task_value = self[task_id].get_field(fieldname)
-                except MissingCustomFieldValue:
-                    task_value = None
-                    pass
+                task_value, _ = self._raw_field_value(by_name, fieldname)
 
                 try:
                     if comparator(task_value, filtvalue):
-                        matched_fields += 1
                         task_fields[fieldname] = task_value
+                    else:
+                        matched = False
+                        break
                 except TypeError:  # as e:
                     # This is probably type errors ebtween Nonetype and int (maybe some other types)
                     # but all of these (far as I'm aware) are not a match in the comparator.
                     # print(e)
-                    pass
+                    matched = False
+                    break
 
-            if matched_fields == len(filter_payload):
+            if matched:
                 # Only add task to return if we successfully match all filters.
                 ret[task_id] = task_fields
         return ret
@@ -870,36 +1303,80 @@ def display_tree(display_tasks=True, display_subtasks=False):
     Options to include tasks and subtasks significantly slow output
     """
 
-    def _get_and_print_subtasks(task_id, pad=6):
+    # Accumulate lines and emit one write at the end rather than a
+    # print call (and stdout flush) per node
+    lines = []
+
+    def _print_task_tree(row, children, pad):
         """
-        Recurse over tasks/subtasks
+        Recurse over tasks/subtasks from the locally grouped rows
         """
-        task = Task(task_id)
         indent = " " * pad
-        if "subtasks" in task.task:
-            for subtask in task.task["subtasks"]:
-                print(f"{indent}task id: {subtask['id']}, name: {subtask['name']}")
-                _get_and_print_subtasks(subtask["id"], pad=pad + 2)
+        lines.append(f"{indent}task id: {row['id']}, name: {row['name']}")
+        for child in children.get(row["id"], ()):
+            _print_task_tree(child, children, pad + 2)
 
     spaces = Spaces()
-    for space in spaces:
-        print(f"space id: {space['id']}, name: {space['name']}")
-        for folder in Folders(space["id"]):
-            print(f"  folder id: {folder['id']}, name: {folder['name']}")
-            for li in FolderLists(folder["id"]):
-                print(f"    list id: {li['id']}, name: {li['name']}")
-                if display_tasks:
-                    for task in Tasks(li["id"]):
-                        print(f"      task id: {task['id']}, name: {task['name']}")
-                        if display_subtasks:
-                            _get_and_print_subtasks(task["id"], pad=8)
-        for li in SpaceLists(space["id"]):
-            print(f"  list id: {li['id']}, name: {li['name']}")
-            if display_tasks:
-                for task in Tasks(li["id"]):
-                    print(f"    task id: {task['id']}, name: {task['name']}")
-                    if display_subtasks:
-                        _get_and_print_subtasks(task["id"], pad=6)
+
+    # The traversal is a nest of independent HTTP GETs, so fetch each
+    # level's children concurrently and join the futures in parent order
+    # to keep the printed tree deterministic.
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        folders_futs = {s["id"]: ex.submit(Folders, s["id"]) for s in spaces}
+        space_lists_futs = {s["id"]: ex.submit(SpaceLists, s["id"]) for s in spaces}
+
+        def _submit_tasks(lists):
+            if not display_tasks:
+                return {}
+            return {
+                li["id"]: ex.submit(
+                    Tasks, li["id"], include_subtasks=display_subtasks
+                )
+                for li in lists
+            }
+
+        def _print_list_tasks(li, tasks_futs, pad):
+            indent = " " * pad
+            lines.append(f"{indent}list id: {li['id']}, name: {li['name']}")
+            if not display_tasks:
+                return
+            tasks = tasks_futs[li["id"]].result()
+            rows = [tasks._task_data[task_id] for task_id in tasks.task_ids]
+            if display_subtasks:
+                # Subtask rows arrived flat in the bulk fetch; group them
+                # by parent and print the tree entirely from the local
+                # map - no per-task GETs
+                children = {}
+                for row in rows:
+                    if row.get("parent"):
+                        children.setdefault(row["parent"], []).append(row)
+                for row in rows:
+                    if not row.get("parent"):
+                        _print_task_tree(row, children, pad + 2)
+            else:
+                for row in rows:
+                    lines.append(
+                        f"{indent}  task id: {row['id']}, name: {row['name']}"
+                    )
+
+        for space in spaces:
+            lines.append(f"space id: {space['id']}, name: {space['name']}")
+            folders = folders_futs[space["id"]].result()
+            folder_lists_futs = {
+                f["id"]: ex.submit(FolderLists, f["id"]) for f in folders
+            }
+            for folder in folders:
+                lines.append(f"  folder id: {folder['id']}, name: {folder['name']}")
+                lists = folder_lists_futs[folder["id"]].result()
+                tasks_futs = _submit_tasks(lists)
+                for li in lists:
+                    _print_list_tasks(li, tasks_futs, pad=4)
+            space_lists = space_lists_futs[space["id"]].result()
+            tasks_futs = _submit_tasks(space_lists)
+            for li in space_lists:
+                _print_list_tasks(li, tasks_futs, pad=2)
+
+    print("\n".join(lines))
 
 
 # DisplayTree above kind of begs for generalizing with some type of iterator
@@ -917,7 +1394,7 @@ def make_task_from_template(list_id, task_id):
 
 
 def time_tracking():
-    url = "https://api.clickup.com/api/v2/team/" + team_id + "/time_entries"
+    url = _TIME_ENTRIES_URL.format(_get_team_id())
 
     # TODO:  Find username ids w/o enterprise features
     # TODO:  start date/end date as calendar dates (10/25/2018)
@@ -934,14 +1411,13 @@ def time_tracking():
         # "list_id": "0",
         # "task_id": "0",
         # "custom_task_ids": "true",
-        "team_id": team_id,
+        "team_id": _get_team_id(),
     }
 
-    response = requests.get(url, headers=headers, params=query)
+    response = _session.get(url, params=query)
 
-    data = response.json()
-    # print(data)
-    durations = [int(item["duration"]) / 1000 / 60 / 60 for item in data["data"]]
-    # print(durations)
-    return sum(durations)
-    return durations
+    data = _json_loads(response)
+    # Sum raw milliseconds in one pass and convert to hours once at the
+    # end - one division instead of three per entry, no intermediate list
+    total_ms = sum(int(item["duration"]) for item in data["data"])
+    return total_ms / 3600000
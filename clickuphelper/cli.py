@@ -3,6 +3,17 @@ import click
 import clickuphelper
 
 
+def _dumps(obj):
+    """
+    Two-space indented JSON via orjson when the optional dependency is
+    installed, stdlib json otherwise.
+    """
+    if clickuphelper.orjson is not None:
+        opts = clickuphelper.orjson.OPT_INDENT_2
+        return clickuphelper.orjson.dumps(obj, option=opts).decode()
+    return json.dumps(obj, indent=2)
+
+
 @click.group(invoke_without_command=True)
 @click.argument("task_id", nargs=1)
 @click.pass_context
@@ -18,7 +29,7 @@ def task(ctx, task_id):
     ctx.obj = task
 
     if ctx.invoked_subcommand is None:
-        click.echo(json.dumps(task.task, indent=2))
+        click.echo(_dumps(task.task))
 
 
 @task.command
@@ -59,7 +70,7 @@ def cf(ctx, names, display):
             elif display == "id":
                 click.echo(ctx.obj.get_field_id(name))
             elif display == "obj":
-                click.echo(json.dumps(ctx.obj.get_field_obj(name), indent=2))
+                click.echo(_dumps(ctx.obj.get_field_obj(name)))
             else:
                 raise ValueError("Unhandled path for choice format {display}")
 
@@ -84,16 +95,18 @@ def subtasks(ctx):
     Display subtasks of task
     """
 
-    def _get_and_print_subtasks(task_id, pad=0):
-        indent = " " * pad
+    # Iterative depth-first walk; each level's task fetches are
+    # prefetched concurrently before the level prints
+    stack = [(ctx.obj.id, 0)]
+    while stack:
+        task_id, pad = stack.pop()
         subtask = clickuphelper.Task(task_id)
-        click.echo(f"{indent}task id: {subtask.id}, name: {subtask.name}")
-
-        if "subtasks" in subtask.task.keys():
-            for subtask in subtask.task["subtasks"]:
-                _get_and_print_subtasks(subtask["id"], pad=pad + 2)
+        click.echo(f"{' ' * pad}task id: {subtask.id}, name: {subtask.name}")
 
-    _get_and_print_subtasks(ctx.obj.id)
+        children = subtask.task.get("subtasks", [])
+        clickuphelper.Task.prefetch([child["id"] for child in children])
+        # Reversed so the stack pops children in display order
+        stack.extend((child["id"], pad + 2) for child in reversed(children))
 
 
 @task.command
@@ -154,7 +167,7 @@ def clickuplist(space_name, folder_name, list_name, display):
         click.echo(clickuphelper.get_list_id(space_name, folder_name, list_name))
     elif display == "list_obj":
         l = clickuphelper.get_list(space_name, folder_name, list_name)
-        click.echo(json.dumps(l.data, indent=2))
+        click.echo(_dumps(l.data))
     elif display == "status_names":
         l = clickuphelper.get_list(space_name, folder_name, list_name)
         click.echo(l.status_names)
@@ -178,7 +191,7 @@ def clickuplist(space_name, folder_name, list_name, display):
 
 @click.command()
 def clickuptime():
-    click.echo(json.dumps(clickuphelper.time_tracking(), indent=2))
+    click.echo(_dumps(clickuphelper.time_tracking()))
 
 @task.command()
 @click.pass_context
@@ -189,4 +202,4 @@ def add_attachment(ctx, file_path):
     """
     task = ctx.obj
     response = task.add_attachment(file_path)
-    click.echo(json.dumps(response, indent=2))
+    click.echo(_dumps(response))